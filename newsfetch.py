@@ -1,23 +1,71 @@
 import os
+import sys
+import time
+import orjson
+import sqlite3
 import requests
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter.font import Font
 from datetime import datetime
-import matplotlib.ticker as ticker
-from bs4 import BeautifulSoup
-import matplotlib.pyplot as plt
-from collections import defaultdict
-import unittest
+from selectolax.lexbor import LexborHTMLParser
+from collections import Counter
 import threading
+import cachetools
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
 
+def _pooled_adapter():
+    return HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+
 class NewsAPIClient:
+    # Shared across instances so every client draws from one keep-alive pool.
+    _SESSION = requests.Session()
+    _SESSION.mount('http://', _pooled_adapter())
+    _SESSION.mount('https://', _pooled_adapter())
+
     def __init__(self, api_key):
         self.api_key = api_key
         self.base_url = "https://newsapi.org/v2/top-headlines"
+        # In-flight dedup: concurrent identical requests share one HTTP
+        # round-trip. The first caller does the work; later ones wait on
+        # the same Future. No artificial delay for the common single call.
+        self._pending = {}  # (category, source, page_size) -> Future
+        self._pending_lock = threading.Lock()
 
     def fetch_news(self, category="", source="", page_size=10):
+        key = (category, source, page_size)
+        with self._pending_lock:
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending[key] = future
+
+        if owner:
+            try:
+                future.set_result(self._fetch(category, source, page_size))
+            except Exception as e:
+                # Failures must reach every waiter, or they block forever.
+                future.set_exception(e)
+            finally:
+                with self._pending_lock:
+                    self._pending.pop(key, None)
+
+        # Each caller gets its own copies; aggregate() mutates them.
+        return [dict(article) for article in future.result()]
+
+    def _fetch(self, category, source, page_size):
         params = {
             'apiKey': self.api_key,
             'pageSize': page_size
@@ -28,41 +76,202 @@ class NewsAPIClient:
             params['sources'] = source
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self._SESSION.get(self.base_url, params=params)
             response.raise_for_status()
-            data = response.json()
+            # orjson parses the raw bytes directly, skipping the decode that
+            # response.json() would do first.
+            data = orjson.loads(response.content)
             return data.get('articles', [])
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching news: {e}")
             return []
 
+# Only ~500 chars of article text are kept, so there is no point pulling
+# megabyte pages off the wire in full.
+MAX_ARTICLE_BYTES = 128 * 1024
+
+# One grouped selector so all targets come back from a single tree walk.
+TARGET_SELECTOR = 'article, div.content, meta'
+
+# Only this much article text is ever kept or shown.
+MAX_CONTENT_CHARS = 500
+
+def _node_text_capped(node, limit=MAX_CONTENT_CHARS):
+    # Accumulate stripped text fragments and bail out at the cap instead of
+    # materializing the whole subtree's text just to slice it afterwards.
+    parts = []
+    size = 0
+    for child in node.traverse(include_text=True):
+        if not child.is_text_node:
+            continue
+        fragment = child.text_content.strip()
+        if not fragment:
+            continue
+        parts.append(fragment)
+        size += len(fragment)
+        if size >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+def _parse_article_html(html):
+    tree = LexborHTMLParser(html)
+
+    article_text = None
+    div_text = None
+    # All meta tags are indexed by (attribute, value) in the same pass, so
+    # each lookup below is a hash probe instead of another tag scan.
+    metas = {}
+
+    for node in tree.css(TARGET_SELECTOR):
+        tag = node.tag
+        if tag == 'article':
+            if article_text is None:
+                article_text = _node_text_capped(node)
+        elif tag == 'div':
+            if div_text is None:
+                div_text = _node_text_capped(node)
+        elif tag == 'meta':
+            attrs = node.attributes
+            name = attrs.get('name')
+            if name:
+                metas.setdefault(('name', name), attrs.get('content'))
+            prop = attrs.get('property')
+            if prop:
+                metas.setdefault(('property', prop), attrs.get('content'))
+
+    text = article_text if article_text is not None else (div_text or "")
+    return {
+        'content': text,
+        'author': metas.get(('name', 'author')) or "Unknown",
+        'publication_date': metas.get(('property', 'article:published_time')) or "Unknown"
+    }
+
+class _ArticleCache:
+    """Sqlite-backed store of parsed article results keyed by URL.
+
+    Persists the parsed dict plus the page's HTTP validators — not the
+    response body — so disk usage stays tiny and nothing here re-reads
+    full pages. Entries older than expire_after are revalidated with a
+    conditional GET rather than trusted outright.
+    """
+
+    def __init__(self, path, expire_after=3600):
+        self._expire_after = expire_after
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS articles '
+            '(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+            'result BLOB, fetched_at REAL)'
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified, result, fetched_at '
+                'FROM articles WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, blob, fetched_at = row
+        fresh = time.time() - fetched_at < self._expire_after
+        return etag, last_modified, orjson.loads(blob), fresh
+
+    def set(self, url, etag, last_modified, result):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?)',
+                (url, etag, last_modified, orjson.dumps(result), time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url):
+        # A 304 proved the entry is still current; restart its clock.
+        with self._lock:
+            self._conn.execute(
+                'UPDATE articles SET fetched_at = ? WHERE url = ?',
+                (time.time(), url)
+            )
+            self._conn.commit()
+
 class WebScraper:
+    # Shared across instances so all scrapers reuse one keep-alive pool.
+    # Deliberately not a body-caching session: transparent response caching
+    # would buffer whole pages and defeat the byte cap below.
+    _SESSION = requests.Session()
+    _SESSION.mount('http://', _pooled_adapter())
+    _SESSION.mount('https://', _pooled_adapter())
+
+    # Articles scraped in a previous run are served from sqlite instead of
+    # re-hitting the network; shared across instances like the session.
+    _CACHE = _ArticleCache('newsfetch_cache.sqlite', expire_after=3600)
+
     def __init__(self):
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Encoding': 'gzip, deflate, br'
         }
+        self._SESSION.headers.update(self.headers)
+        # In-process L1 over the on-disk store. TTL-bounded so stale
+        # articles age out and memory stays capped; the lock keeps it safe
+        # once scrapes run concurrently.
+        self._result_cache = cachetools.TTLCache(maxsize=256, ttl=600)
+        self._cache_lock = threading.Lock()
 
-    @lru_cache(maxsize=100)
     def scrape_article(self, url):
         try:
-            response = requests.get(url, headers=self.headers, timeout=5)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            content = soup.find('article') or soup.find('div', class_='content')
-            text = content.get_text(strip=True) if content else ""
-
-            author = soup.find('meta', {'name': 'author'})
-            author = author['content'] if author else "Unknown"
-
-            pub_date = soup.find('meta', {'property': 'article:published_time'})
-            pub_date = pub_date['content'] if pub_date else "Unknown"
-
-            return {
-                'content': text[:500] if text else "",
-                'author': author,
-                'publication_date': pub_date
-            }
+            # L1: a fresh in-process hit costs no network at all.
+            with self._cache_lock:
+                hit = self._result_cache.get(url)
+            if hit is not None:
+                return hit
+
+            # L2: fresh on-disk entries also skip the network; stale ones
+            # contribute validators for a conditional GET.
+            etag = last_modified = stored_result = None
+            stored = self._CACHE.get(url)
+            if stored:
+                etag, last_modified, stored_result, fresh = stored
+                if fresh:
+                    with self._cache_lock:
+                        self._result_cache[url] = stored_result
+                    return stored_result
+
+            headers = {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+            # The context manager releases the connection back to the pool
+            # as soon as the capped read is done, even on early exits.
+            with self._SESSION.get(url, timeout=5, headers=headers, stream=True) as response:
+                # Page unchanged: refresh the stored entry, skip re-parsing.
+                if stored_result is not None and response.status_code == 304:
+                    self._CACHE.touch(url)
+                    with self._cache_lock:
+                        self._result_cache[url] = stored_result
+                    return stored_result
+                response.raise_for_status()
+
+                # Stream the body and stop reading at the cap. The session
+                # does no transparent body caching, so this bounds the bytes
+                # pulled off the wire, not just what gets parsed.
+                buf = bytearray()
+                for chunk in response.iter_content(8192):
+                    buf.extend(chunk)
+                    if len(buf) > MAX_ARTICLE_BYTES:
+                        break
+                validators = (response.headers.get('ETag'),
+                              response.headers.get('Last-Modified'))
+
+            result = _parse_article_html(bytes(buf))
+            self._CACHE.set(url, validators[0], validators[1], result)
+            with self._cache_lock:
+                self._result_cache[url] = result
+            return result
         except (requests.RequestException, AttributeError) as e:
             print(f"Error scraping article: {e}")
             return {'content': '', 'author': 'Unknown', 'publication_date': 'Unknown'}
@@ -72,36 +281,80 @@ class NewsAggregator:
         self.api_client = NewsAPIClient(api_key)
         self.scraper = WebScraper()
         self.articles = []
+        # scrape_article is dominated by socket waits, which release the
+        # GIL, so a thread pool overlaps the fetches while every request
+        # still goes through the sqlite and conditional-GET caches.
+        self._scrape_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='scrape')
 
     def aggregate(self, category="", source="", page_size=10):
         self.articles = self.api_client.fetch_news(category, source, page_size)
         print(f"[DEBUG] Fetched {len(self.articles)} articles")
-        for article in self.articles:
-            if article.get('url'):
-                scraped_data = self.scraper.scrape_article(article['url'])
+        # Dedup before scraping so duplicates never reach the network.
+        self._clean_data()
+        self._scrape_articles()
+
+    def _scrape_articles(self):
+        # Hoist lookups out of the hot loop and key everything by URL, so
+        # each distinct URL is fetched and parsed exactly once even when the
+        # API returns duplicates.
+        scrape = self.scraper.scrape_article
+        todo = [(article, article.get('url')) for article in self.articles]
+        urls = list(dict.fromkeys(url for _, url in todo if url))
+        if not urls:
+            return
 
-                # Fallback to API content if scraping fails
-                if not scraped_data.get("content"):
-                    scraped_data["content"] = article.get("description") or article.get("content") or "Content not available"
+        results = dict(zip(urls, self._scrape_pool.map(scrape, urls)))
 
-                article.update(scraped_data)
-        self._clean_data()
+        for article, url in todo:
+            if not url:
+                continue
+            # Copy: duplicate articles share one scraped result, but the
+            # content fallback below is per-article.
+            scraped_data = dict(results.get(url) or {'content': '', 'author': 'Unknown', 'publication_date': 'Unknown'})
+
+            # Fallback to API content if scraping fails
+            if not scraped_data.get("content"):
+                scraped_data["content"] = article.get("description") or article.get("content") or "Content not available"
+
+            article.update(scraped_data)
 
     def _clean_data(self):
-        seen_urls = set()
-        unique_articles = []
+        # A dict keyed by URL gives order-preserving dedup in one pass,
+        # using its hash table as the "seen" set.
+        by_url = {}
         for article in self.articles:
-            if article.get('url') and article['url'] not in seen_urls:
-                seen_urls.add(article['url'])
-                unique_articles.append(article)
-        self.articles = unique_articles
+            url = article.get('url')
+            if url and url not in by_url:
+                by_url[url] = article
+        self.articles = list(by_url.values())
 
     def get_category_distribution(self):
-        categories = defaultdict(int)
-        for article in self.articles:
-            source = article.get('source', {}).get('name', 'Unknown')
-            categories[source] += 1
-        return categories
+        return Counter(
+            article.get('source', {}).get('name', 'Unknown')
+            for article in self.articles
+        )
+
+# fromisoformat accepts a trailing 'Z' natively from 3.11 on.
+_ISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+@lru_cache(maxsize=512)
+def _parse_iso(raw):
+    if not _ISO_HANDLES_Z:
+        raw = raw.replace("Z", "+00:00")
+    return datetime.fromisoformat(raw)
+
+# Built once at import instead of re-expanding an f-string (and the
+# separator rule) per article.
+SEPARATOR = '=' * 80
+DISPLAY_TEMPLATE = (
+    SEPARATOR + "\n"
+    "📰 Title: {title}\n"
+    "📢 Source: {source}\n"
+    "✍️ Author: {author}\n"
+    "📅 Published: {date}\n\n"
+    "{content}...\n"
+    + SEPARATOR + "\n\n"
+)
 
 class NewsGUI:
     def __init__(self, aggregator):
@@ -110,13 +363,19 @@ class NewsGUI:
         self.root.title("News Aggregator")
         self.root.geometry("900x700")
         self.root.configure(bg="#f5f5f5")
+        # Fonts allocate Tcl objects; create them once and reuse.
+        self.title_font = Font(family="Helvetica", size=16, weight="bold")
+        self.label_font = Font(family="Helvetica", size=12)
+        # One persistent worker pool instead of a fresh thread per click;
+        # bounds concurrency no matter how fast the user clicks.
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='fetch')
         self._setup_gui()
         self.loading_label = tk.Label(self.root, text="", font=("Helvetica", 12), fg="blue", bg="#f5f5f5")
         self.loading_label.pack(pady=5)
 
     def _setup_gui(self):
-        title_font = Font(family="Helvetica", size=16, weight="bold")
-        label_font = Font(family="Helvetica", size=12)
+        title_font = self.title_font
+        label_font = self.label_font
 
         title_label = tk.Label(self.root, text="News Aggregator", font=title_font, bg="#f5f5f5", fg="#333")
         title_label.pack(pady=10)
@@ -145,8 +404,8 @@ class NewsGUI:
         button_frame = ttk.Frame(self.root, padding=10)
         button_frame.pack(pady=10)
 
-        fetch_button = ttk.Button(button_frame, text="Fetch News", command=self.fetch_news)
-        fetch_button.grid(row=0, column=0, padx=10)
+        self.fetch_button = ttk.Button(button_frame, text="Fetch News", command=self.fetch_news)
+        self.fetch_button.grid(row=0, column=0, padx=10)
 
         visualize_button = ttk.Button(button_frame, text="Visualize Distribution", command=self.visualize)
         visualize_button.grid(row=0, column=1, padx=10)
@@ -172,7 +431,18 @@ class NewsGUI:
             return
 
         self.loading_label.config(text="Fetching news, please wait...")
-        threading.Thread(target=self._fetch_news_thread, args=(category, source, num_articles)).start()
+        self.fetch_button.config(state="disabled")
+        future = self._executor.submit(self._fetch_news_thread, category, source, num_articles)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_fetch_done, f))
+
+    def _on_fetch_done(self, future):
+        # Runs on every completion path, including the "no articles" early
+        # return, so the loading text never sticks around.
+        self.fetch_button.config(state="normal")
+        self.loading_label.config(text="")
+        exc = future.exception()
+        if exc:
+            messagebox.showerror("Error", f"Fetch failed: {exc}")
 
     def _fetch_news_thread(self, category, source, num_articles):
         self.aggregator.aggregate(category, source, num_articles)
@@ -180,74 +450,70 @@ class NewsGUI:
             self.root.after(0, lambda: messagebox.showerror("Error", "No articles found!"))
             return
 
+        parts = []
         for article in self.aggregator.articles:
             raw_date = article.get('publication_date', 'Unknown')
             if raw_date != 'Unknown':
                 try:
-                    dt = datetime.fromisoformat(raw_date.replace("Z", "+00:00"))
-                    formatted_date = dt.strftime('%Y-%m-%d %H:%M')
+                    formatted_date = _parse_iso(raw_date).strftime('%Y-%m-%d %H:%M')
                 except ValueError:
                     formatted_date = raw_date
             else:
                 formatted_date = 'Unknown'
 
-            display_text = (
-                f"{'='*80}\n"
-                f"📰 Title: {article.get('title', 'N/A')}\n"
-                f"📢 Source: {article.get('source', {}).get('name', 'N/A')}\n"
-                f"✍️ Author: {article.get('author', 'Unknown')}\n"
-                f"📅 Published: {formatted_date}\n\n"
-                f"{article.get('content', '')[:300]}...\n"
-                f"{'='*80}\n\n"
-            )
-            self.text_area.insert(tk.END, display_text)
+            parts.append(DISPLAY_TEMPLATE.format(
+                title=article.get('title', 'N/A'),
+                source=article.get('source', {}).get('name', 'N/A'),
+                author=article.get('author', 'Unknown'),
+                date=formatted_date,
+                content=article.get('content', '')[:300]
+            ))
+
+        # One insert on the Tk thread instead of one Tcl round-trip per
+        # article (Tk widgets are not thread-safe).
+        self.root.after(0, self._display_results, ''.join(parts))
 
-        self.root.after(0, lambda: self.loading_label.config(text=""))
+    def _display_results(self, text):
+        self.text_area.insert(tk.END, text)
+        self.text_area.see("1.0")
 
     def visualize(self):
         distribution = self.aggregator.get_category_distribution()
         if not distribution:
             messagebox.showerror("Error", "No data to visualize!")
             return
+        self._draw_bar_chart(distribution)
 
-        plt.figure(figsize=(10, 6))
-        plt.bar(distribution.keys(), distribution.values(), color="#4CAF50")
-        plt.gca().yaxis.set_major_locator(ticker.MaxNLocator(integer=True))
-        plt.xticks(rotation=45)
-        plt.xlabel("Sources")
-        plt.ylabel("Number of Articles")
-        plt.title("Distribution of News Articles by Source")
-        plt.tight_layout()
-        plt.show()
+    def _draw_bar_chart(self, distribution):
+        width, height, margin = 800, 500, 70
+
+        window = tk.Toplevel(self.root)
+        window.title("Distribution of News Articles by Source")
+        canvas = tk.Canvas(window, width=width, height=height, bg="white")
+        canvas.pack(fill="both", expand=True)
+
+        canvas.create_text(width / 2, margin / 2, text="Distribution of News Articles by Source",
+                           font=("Helvetica", 14, "bold"))
+
+        items = list(distribution.items())
+        max_count = max(distribution.values())
+        baseline = height - margin
+        slot = (width - 2 * margin) / len(items)
+
+        for i, (source, count) in enumerate(items):
+            x0 = margin + i * slot + slot * 0.15
+            x1 = margin + (i + 1) * slot - slot * 0.15
+            y0 = baseline - (height - 2 * margin) * count / max_count
+            canvas.create_rectangle(x0, y0, x1, baseline, fill="#4CAF50", outline="")
+            canvas.create_text((x0 + x1) / 2, y0 - 10, text=str(count), font=("Helvetica", 10))
+            canvas.create_text((x0 + x1) / 2, baseline + 8, text=source,
+                               font=("Helvetica", 9), angle=45, anchor="ne")
+
+        canvas.create_line(margin, baseline, width - margin, baseline)
 
     def run(self):
         self.root.mainloop()
 
-# For unit testing (optional)
-class TestNewsAggregator(unittest.TestCase):
-    def setUp(self):
-        self.aggregator = NewsAggregator("75e01f0496064d5683ff5abdc0783a10")
-
-    def test_api_fetch(self):
-        articles = self.aggregator.api_client.fetch_news(category="technology")
-        self.assertIsInstance(articles, list)
-
-    def test_scraper(self):
-        scraper = WebScraper()
-        result = scraper.scrape_article("https://www.example.com")
-        self.assertIsInstance(result, dict)
-        self.assertIn('content', result)
-        self.assertIn('author', result)
-
-    def test_data_cleaning(self):
-        self.aggregator.articles = [
-            {'url': 'test1', 'title': 'Test'},
-            {'url': 'test1', 'title': 'Test'},
-            {'url': 'test2', 'title': 'Test2'}
-        ]
-        self.aggregator._clean_data()
-        self.assertEqual(len(self.aggregator.articles), 2)
-
 if __name__ == "__main__":
     API_KEY = os.getenv("NEWS_API_KEY", "75e01f0496064d5683ff5abdc0783a10")
     aggregator = NewsAggregator(API_KEY)
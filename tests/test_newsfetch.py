@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from newsfetch import MAX_ARTICLE_BYTES, NewsAggregator, WebScraper, _ArticleCache
+
+class TestNewsAggregator(unittest.TestCase):
+    def setUp(self):
+        self.aggregator = NewsAggregator("75e01f0496064d5683ff5abdc0783a10")
+
+    def test_api_fetch(self):
+        articles = self.aggregator.api_client.fetch_news(category="technology")
+        self.assertIsInstance(articles, list)
+
+    def test_scraper(self):
+        scraper = WebScraper()
+        result = scraper.scrape_article("https://www.example.com")
+        self.assertIsInstance(result, dict)
+        self.assertIn('content', result)
+        self.assertIn('author', result)
+
+    def test_data_cleaning(self):
+        self.aggregator.articles = [
+            {'url': 'test1', 'title': 'Test'},
+            {'url': 'test1', 'title': 'Test'},
+            {'url': 'test2', 'title': 'Test2'}
+        ]
+        self.aggregator._clean_data()
+        self.assertEqual(len(self.aggregator.articles), 2)
+
+class _ArticleHandler(BaseHTTPRequestHandler):
+    """Serves a multi-megabyte article page, recording what each request
+    actually managed to send before the client hung up."""
+    body = (b'<html><body><article>capped</article><p>'
+            + b'x' * (4 * 1024 * 1024) + b'</p></body></html>')
+    hits = []
+    bytes_sent = []
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        sent = 0
+        try:
+            for i in range(0, len(self.body), 65536):
+                self.wfile.write(self.body[i:i + 65536])
+                self.wfile.flush()
+                sent = min(i + 65536, len(self.body))
+                # Pace the writes so socket buffers drain and a client
+                # that stopped reading shows up as a broken pipe here.
+                time.sleep(0.005)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.bytes_sent.append(sent)
+
+    def log_message(self, *args):
+        pass
+
+class TestWebScraperCaching(unittest.TestCase):
+    def setUp(self):
+        _ArticleHandler.hits = []
+        _ArticleHandler.bytes_sent = []
+        self._saved_cache = WebScraper._CACHE
+        WebScraper._CACHE = _ArticleCache(':memory:')
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _ArticleHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/article'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        WebScraper._CACHE = self._saved_cache
+
+    def test_download_cap_bounds_wire_bytes(self):
+        # The cap must limit what comes off the wire, not just what gets
+        # parsed: a session that transparently buffers whole bodies would
+        # pass a parse-only check but still download all 4 MB.
+        result = WebScraper().scrape_article(self.url)
+        self.assertEqual(result['content'], 'capped')
+        time.sleep(0.5)  # let the server observe the hang-up
+        self.assertLess(_ArticleHandler.bytes_sent[0], 8 * MAX_ARTICLE_BYTES)
+
+    def test_repeat_scrapes_skip_network(self):
+        scraper = WebScraper()
+        first = scraper.scrape_article(self.url)
+        second = scraper.scrape_article(self.url)
+        # A fresh instance has an empty in-process cache, so this only
+        # passes if the sqlite store served it.
+        third = WebScraper().scrape_article(self.url)
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(len(_ArticleHandler.hits), 1)
+
+if __name__ == "__main__":
+    unittest.main()